@@ -2,7 +2,11 @@
 Branch Predictor Visualization Dashboard
 """
 
-from dash import Dash, html, dcc, Output, Input, dash_table
+from functools import lru_cache
+
+from dash import Dash, html, dcc, Output, Input, State, ctx, dash_table, no_update
+from dash.exceptions import PreventUpdate
+import numpy as np
 import plotly.graph_objects as go
 
 from src.utils import (
@@ -10,6 +14,7 @@ from src.utils import (
     load_predictor_config,
     extract_trace_summary,
     parse_data_for_loop_frequencies,
+    natural_sort_key,
 )
 from src.components.treemap import create_tree_map
 from src.components.heatmap import create_heatmap
@@ -19,6 +24,7 @@ from src.components.timeseries import create_timeseries
 from src.components.stacked import create_stacked_area
 from src.components.predictor_info import create_predictor_info
 from src.components.summary_cards import create_summary_cards
+from src.components.density import create_density_overview, parse_relayout_range
 
 GRAPH_CONFIG = {
     'toImageButtonOptions': {
@@ -34,12 +40,33 @@ def create_app(data_folder: str = "sample_data",
                config_path: str = "sample_data/predictor.yml") -> Dash:
     """Create and configure the Dash application."""
 
+    # Trace data stays on the server, callbacks look traces up by name
     sim_data = load_all_simulation_data(data_folder)
     predictor_config = load_predictor_config(config_path)
 
     trace_names = list(sim_data.keys())
     default_trace = trace_names[0] if trace_names else None
 
+    # Size maps are interned per configuration, build each treemap only once
+    tree_maps = {}
+    for trace_data in sim_data.values():
+        if trace_data.size_map_hash not in tree_maps:
+            tree_maps[trace_data.size_map_hash] = create_tree_map(trace_data.size_map)
+
+    # Suite overview rasterizes all MPKBr series with rows sorted by name (and so
+    # by suite), the default MPKBr range cuts off the top percentile of spikes
+    density_names = sorted(trace_names, key=natural_sort_key)
+    mpkbr_series = [sim_data[name].MPKBr_periodic for name in density_names]
+    mpkbr_max = max(
+        (float(np.percentile(series, 99)) for series in mpkbr_series if len(series)),
+        default=0.0,
+    ) or 1.0
+    full_density_view = {'x': [0.0, 1.0], 'y': [0.0, mpkbr_max]}
+
+    @lru_cache(maxsize=64)
+    def render_density_overview(mode: str, x_range: tuple, y_range: tuple) -> go.Figure:
+        return create_density_overview(mpkbr_series, density_names, mode, x_range, y_range)
+
     # Build table data with summary statistics for each trace
     table_data = [
         extract_trace_summary(name, sim_data[name])
@@ -53,9 +80,6 @@ def create_app(data_folder: str = "sample_data",
         className="main-container",
         children=[
 
-            # Store simulation data in browser
-            dcc.Store(id='sim-data-store', data=sim_data),
-
             # Header
             html.Div(
                 className="header",
@@ -78,6 +102,32 @@ def create_app(data_folder: str = "sample_data",
                         className="tree-map-description"
                     ),
                     dcc.Graph(id='tree-map'),
+                    # Store the size map hash of the shown treemap
+                    dcc.Store(id='tree-map-hash-store'),
+                ]
+            ),
+
+            html.Div(
+                className="chart-container",
+                children=[
+                    html.H3("MPKBr Density across All Traces", className="section-title"),
+                    html.P(
+                        "Server-side rasterized overview of MPKBr of all traces over normalized time. "
+                        "Zooming re-rasterizes the visible range.",
+                        className="heatmap-description"
+                    ),
+                    dcc.RadioItems(
+                        id='density-mode',
+                        options=[
+                            {'label': 'Traces x Time', 'value': 'traces'},
+                            {'label': 'MPKBr x Time', 'value': 'mpkbr'},
+                        ],
+                        value='traces',
+                        inline=True,
+                    ),
+                    dcc.Graph(id='density-overview', config=GRAPH_CONFIG),
+                    # Store the currently rasterized range
+                    dcc.Store(id='density-view-store', data=full_density_view),
                 ]
             ),
 
@@ -106,6 +156,8 @@ def create_app(data_folder: str = "sample_data",
                              "format": {"specifier": ",.0f"}},
                             {"name": "Mispred/1K Inst", "id": "MISPRED_PER_1K_INST", "type": "numeric",
                              "format": {"specifier": ".4f"}},
+                            {"name": "MPKBr over Time", "id": "MPKBR_SPARKLINE"},
+                            {"name": "TAGE Usefull Entries", "id": "TAGE_SPARKLINE"},
                         ],
                         data=table_data,
                         style_table={'overflowX': 'auto'},
@@ -114,6 +166,17 @@ def create_app(data_folder: str = "sample_data",
                             'padding': '12px 15px',
                             'fontFamily': '-apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif',
                         },
+                        style_cell_conditional=[
+                            {
+                                'if': {'column_id': column_id},
+                                'fontFamily': 'monospace',
+                                'fontSize': '8px',
+                                'letterSpacing': '0',
+                                'whiteSpace': 'nowrap',
+                                'color': '#440154',
+                            }
+                            for column_id in ("MPKBR_SPARKLINE", "TAGE_SPARKLINE")
+                        ],
                         style_header={
                             'backgroundColor': '#1a365d',
                             'color': 'white',
@@ -220,107 +283,147 @@ def create_app(data_folder: str = "sample_data",
     )
 
     # Callback to update selected trace store when a cell is clicked
-    # Uses active_cell and derived_virtual_data (sorted view) to get the trace name
+    # Uses active_cell and derived_virtual_indices (sorted view) to get the trace name,
+    # so the browser does not upload the whole table on every click
     @app.callback(
         Output('selected-trace-store', 'data'),
         Input('trace-table', 'active_cell'),
-        Input('trace-table', 'derived_virtual_data')
+        Input('trace-table', 'derived_virtual_indices')
     )
-    def update_selected_trace(active_cell, virtual_data):
-        if active_cell is None or not virtual_data:
+    def update_selected_trace(active_cell, virtual_indices):
+        if active_cell is None or not virtual_indices:
             return default_trace
         row_idx = active_cell['row']
-        if row_idx < len(virtual_data):
-            return virtual_data[row_idx]['Trace']
+        if row_idx < len(virtual_indices):
+            return trace_names[virtual_indices[row_idx]]
         return default_trace
 
     @app.callback(
         Output('stats-container', 'children'),
-        Input('selected-trace-store', 'data'),
-        Input('sim-data-store', 'data')
+        Input('selected-trace-store', 'data')
     )
-    def update_stats(selected_trace, sim_data):
-        if not selected_trace or not sim_data:
+    def update_stats(selected_trace):
+        trace_data = sim_data.get(selected_trace)
+        if trace_data is None:
             return []
-        trace_data = sim_data.get(selected_trace, {})
         return create_summary_cards(trace_data)
 
     @app.callback(
         Output('heatmap-graph', 'figure'),
-        Input('selected-trace-store', 'data'),
-        Input('sim-data-store', 'data')
+        Input('selected-trace-store', 'data')
     )
-    def update_heatmap(selected_trace, sim_data):
-        if not selected_trace or not sim_data:
+    def update_heatmap(selected_trace):
+        trace_data = sim_data.get(selected_trace)
+        if trace_data is None:
             return go.Figure()
-        trace_data = sim_data.get(selected_trace, {})
-        return create_heatmap(trace_data.get("heatmap_bimodal_table", []))
+        return create_heatmap(trace_data.heatmap_bimodal_table)
 
     @app.callback(
         Output('timeseries-graph', 'figure'),
-        Input('selected-trace-store', 'data'),
-        Input('sim-data-store', 'data')
+        Input('selected-trace-store', 'data')
     )
-    def update_timeseries(selected_trace, sim_data):
-        if not selected_trace or not sim_data:
+    def update_timeseries(selected_trace):
+        trace_data = sim_data.get(selected_trace)
+        if trace_data is None:
             return go.Figure()
-        trace_data = sim_data.get(selected_trace, {})
-        return create_timeseries(trace_data.get("MPKBr_periodic", []))
+        return create_timeseries(trace_data.MPKBr_periodic)
 
     @app.callback(
         Output('tree-map', 'figure'),
+        Output('tree-map-hash-store', 'data'),
         Input('selected-trace-store', 'data'),
-        Input('sim-data-store', 'data')
+        State('tree-map-hash-store', 'data')
     )
-    def update_tree_map(selected_trace, sim_data):
-        if not selected_trace or not sim_data:
-            return go.Figure()
-        trace_data = sim_data.get(selected_trace, {})
-        return create_tree_map(trace_data.get("size_map", []))
+    def update_tree_map(selected_trace, shown_hash):
+        trace_data = sim_data.get(selected_trace)
+        if trace_data is None:
+            return go.Figure(), None
+        # Traces of the same configuration share the treemap, keep the shown one
+        if trace_data.size_map_hash == shown_hash:
+            return no_update, no_update
+        return tree_maps[trace_data.size_map_hash], trace_data.size_map_hash
 
     @app.callback(
         Output('stacked-graph', 'figure'),
-        Input('selected-trace-store', 'data'),
-        Input('sim-data-store', 'data')
+        Input('selected-trace-store', 'data')
     )
-    def update_stacked_graph(selected_trace, sim_data):
-        if not selected_trace or not sim_data:
+    def update_stacked_graph(selected_trace):
+        trace_data = sim_data.get(selected_trace)
+        if trace_data is None:
             return go.Figure()
-        trace_data = sim_data.get(selected_trace, {})
         names = [ "Shared table 1", "Shared table 2" ]
-        return create_stacked_area(trace_data.get("tage_usefull_entries", []), names)
+        return create_stacked_area(trace_data.tage_usefull_entries, names)
 
     @app.callback(
         Output('src-misp-graph', 'figure'),
-        Input('selected-trace-store', 'data'),
-        Input('sim-data-store', 'data')
+        Input('selected-trace-store', 'data')
     )
-    def update_src_misp_graph(selected_trace, sim_data):
-        if not selected_trace or not sim_data:
+    def update_src_misp_graph(selected_trace):
+        trace_data = sim_data.get(selected_trace)
+        if trace_data is None:
             return go.Figure()
-        trace_data = sim_data.get(selected_trace, {})
         return create_src_misp_graph(trace_data)
 
     @app.callback(
         Output('loop-frequencies', 'figure'),
-        Input('selected-trace-store', 'data'),
-        Input('sim-data-store', 'data')
+        Input('selected-trace-store', 'data')
     )
-    def update_loop_freq_graph(selected_trace, sim_data):
-        if not selected_trace or not sim_data:
+    def update_loop_freq_graph(selected_trace):
+        trace_data = sim_data.get(selected_trace)
+        if trace_data is None:
             return go.Figure()
-        trace_data = sim_data.get(selected_trace, {})
 
-        data = parse_data_for_loop_frequencies(trace_data.get("loop_predictor_loop_counts", []))
+        data = parse_data_for_loop_frequencies(trace_data)
         return create_bar_graph(data)
 
+    # Re-rasterize the density overview for the visible range on zoom
+    @app.callback(
+        Output('density-overview', 'figure'),
+        Output('density-view-store', 'data'),
+        Input('density-overview', 'relayoutData'),
+        Input('density-mode', 'value'),
+        State('density-view-store', 'data')
+    )
+    def update_density_overview(relayout_data, mode, view):
+        if ctx.triggered_id != 'density-overview' or not view:
+            view = full_density_view
+        else:
+            view = dict(view)
+            ranges = {
+                'x': parse_relayout_range(relayout_data, 'xaxis'),
+                'y': parse_relayout_range(relayout_data, 'yaxis') if mode == 'mpkbr' else None,
+            }
+            if ranges['x'] is None and ranges['y'] is None:
+                raise PreventUpdate
+
+            for axis, new_range in ranges.items():
+                if new_range == "auto":
+                    view[axis] = full_density_view[axis]
+                elif new_range is not None:
+                    # Time is normalized to [0, 1], MPKBr can only be clipped from below
+                    start = round(max(new_range[0], 0.0), 6)
+                    end = round(min(new_range[1], 1.0) if axis == 'x' else new_range[1], 6)
+                    if end <= start:
+                        raise PreventUpdate
+                    view[axis] = [start, end]
+
+        fig = render_density_overview(mode, tuple(view['x']), tuple(view['y']))
+        return fig, view
+
 
     return app
 
-# Create app instance at module level for gunicorn
-app = create_app()
-server = app.server  # Gunicorn will import this
+def __getattr__(name: str):
+    # Create app instance on first access of `app`/`server` (gunicorn app:server),
+    # so importing create_app alone does not load any data
+    if name in ("app", "server"):
+        global app, server
+        app = create_app()
+        server = app.server  # Gunicorn will import this
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 if __name__ == "__main__":
     print("Starting Branch Predictor Visualization Dashboard")
+    app = create_app()
     app.run(debug=True)
@@ -0,0 +1,245 @@
+"""
+Load test for the dashboard callbacks.
+
+Runs in-process against the Flask server, no browser needed. Each simulated
+user replays sessions of sorting the trace table, clicking traces and zooming
+graphs by posting to the Dash callback endpoint, the same way the browser does.
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import tempfile
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from app import create_app
+
+SELECTED_TRACE = "selected-trace-store.data"
+SORT_COLUMNS = [
+    "Trace", "NUM_INSTRUCTIONS", "NUM_BR", "NUM_MISPREDICTIONS", "MISPRED_PER_1K_INST",
+]
+
+
+def generate_synthetic_data(template_path: str, out_folder: str,
+                            num_traces: int, num_points: int, seed: int = 0) -> None:
+    """Write `num_traces` synthetic traces with `num_points` periods each.
+
+    Series are tiled from a real trace and scaled by random noise, so the
+    value ranges (and therefore the dtypes picked at load) stay realistic.
+    """
+    rng = np.random.default_rng(seed)
+    with open(template_path, 'r') as f:
+        template = next(iter(json.load(f).values()))
+
+    for i in range(num_traces):
+        name = f"SYNTHETIC-{i}"
+        trace = dict(template, TRACE=name)
+        noise = rng.uniform(0.5, 1.5, num_points)
+
+        trace["MPKBr_periodic"] = (np.resize(template["MPKBr_periodic"], num_points) * noise).tolist()
+        trace["tage_usefull_entries"] = [
+            (np.resize(entries, num_points) * noise).astype(int).tolist()
+            for entries in template["tage_usefull_entries"]
+        ]
+        trace["NUM_MISPREDICTIONS"] = int(template["NUM_MISPREDICTIONS"] * noise[0])
+
+        with open(Path(out_folder) / f"{name}.json", 'w') as f:
+            json.dump({name: trace}, f)
+
+
+def current_rss_mb() -> float | None:
+    """Current resident set size of this process in MB, None if it cannot be read."""
+    gc.collect()
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE') / 2**20
+    except OSError:
+        pass
+
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().rss / 2**20
+
+
+def format_mb(value: float | None) -> str:
+    return "N/A" if value is None else f"{value:.0f} MB"
+
+
+class CallbackClient:
+    """Posts callback requests built from the app's own dependency list.
+
+    Keeps the last known value of every property, so inputs and state are
+    sent the way the browser would send them.
+    """
+
+    def __init__(self, server, dependencies: list, initial_values: dict):
+        self.client = server.test_client()
+        self.dependencies = {dep['output']: dep for dep in dependencies}
+        self.values = dict(initial_values)
+        self.trace_dependents = [
+            dep['output'] for dep in dependencies
+            if any(f"{i['id']}.{i['property']}" == SELECTED_TRACE for i in dep['inputs'])
+        ]
+        self.zoomable = [
+            (dep['output'], f"{i['id']}.{i['property']}")
+            for dep in dependencies for i in dep['inputs'] if i['property'] == 'relayoutData'
+        ]
+
+    def call(self, output: str, changed: dict, timings: dict) -> dict:
+        dep = self.dependencies[output]
+        self.values.update(changed)
+        outputs = [key.rsplit('.', 1) for key in output.strip('.').split('...')]
+        body = {
+            'output': output,
+            'outputs': ({'id': outputs[0][0], 'property': outputs[0][1]} if len(outputs) == 1
+                        else [{'id': out_id, 'property': out_prop} for out_id, out_prop in outputs]),
+            'inputs': [
+                {'id': i['id'], 'property': i['property'],
+                 'value': self.values.get(f"{i['id']}.{i['property']}")}
+                for i in dep['inputs']
+            ],
+            'changedPropIds': list(changed),
+            'state': [
+                {'id': s['id'], 'property': s['property'],
+                 'value': self.values.get(f"{s['id']}.{s['property']}")}
+                for s in dep['state']
+            ],
+        }
+
+        start = time.perf_counter()
+        response = self.client.post('/_dash-update-component', json=body)
+        timings['.'.join(outputs[0])].append(time.perf_counter() - start)
+
+        if response.status_code == 204:
+            return {}
+        if response.status_code != 200:
+            raise RuntimeError(f"{output} returned HTTP {response.status_code}")
+
+        result = {
+            f"{out_id}.{out_prop}": value
+            for out_id, props in response.get_json()['response'].items()
+            for out_prop, value in props.items()
+        }
+        self.values.update(result)
+        return result
+
+    def select_trace(self, changed: dict, timings: dict):
+        """Update the selected trace and fire every callback the browser fires after it."""
+        trace = self.call(SELECTED_TRACE, changed, timings).get(SELECTED_TRACE)
+        for output in self.trace_dependents:
+            self.call(output, {SELECTED_TRACE: trace}, timings)
+
+    def zoom(self, rng: random.Random, timings: dict):
+        """Zoom every graph with a server-side zoom callback into a random range and back."""
+        for output, relayout in self.zoomable:
+            start = rng.uniform(0.0, 0.9)
+            self.call(output, {relayout: {'xaxis.range[0]': start,
+                                          'xaxis.range[1]': start + rng.uniform(0.01, 0.1)}}, timings)
+            self.call(output, {relayout: {'xaxis.autorange': True}}, timings)
+
+
+def run_session(client: CallbackClient, table_data: list, clicks: int,
+                rng: random.Random, timings: dict) -> None:
+    """Sort the table by a random column, click through a few rows and zoom."""
+    column = rng.choice(SORT_COLUMNS)
+    indices = sorted(range(len(table_data)), key=lambda i: table_data[i][column],
+                     reverse=rng.random() < 0.5)
+    client.select_trace({"trace-table.derived_virtual_indices": indices}, timings)
+
+    for _ in range(clicks):
+        active_cell = {'row': rng.randrange(min(len(indices), 10)), 'column': 0}
+        client.select_trace({"trace-table.active_cell": active_cell}, timings)
+
+    client.zoom(rng, timings)
+
+
+def run_user(server, dependencies: list, initial_values: dict, table_data: list,
+             sessions: int, clicks: int, seed: int) -> dict:
+    client = CallbackClient(server, dependencies, initial_values)
+    rng = random.Random(seed)
+    timings = defaultdict(list)
+    for _ in range(sessions):
+        run_session(client, table_data, clicks, rng, timings)
+    return timings
+
+
+def run_load_test(data_folder: str, users: int, sessions: int, clicks: int, seed: int = 0) -> None:
+    rss_before = current_rss_mb()
+    app = create_app(data_folder)
+    rss_loaded = current_rss_mb()
+
+    table_data = app.layout['trace-table'].data
+    client = app.server.test_client()
+    dependencies = client.get('/_dash-dependencies').get_json()
+    initial_values = {
+        f"{prop['id']}.{prop['property']}": getattr(app.layout[prop['id']], prop['property'], None)
+        for dep in dependencies for prop in dep['inputs'] + dep['state']
+    }
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=users) as pool:
+        results = list(pool.map(
+            lambda user: run_user(app.server, dependencies, initial_values, table_data,
+                                  sessions, clicks, seed + user),
+            range(users),
+        ))
+    elapsed = time.perf_counter() - start
+    rss_after = current_rss_mb()
+
+    timings = defaultdict(list)
+    for result in results:
+        for output, samples in result.items():
+            timings[output].extend(samples)
+    total = sum(len(samples) for samples in timings.values())
+
+    print(f"Data: {data_folder} ({len(table_data)} traces)")
+    print(f"Users: {users}, sessions/user: {sessions}, clicks/session: {clicks}")
+    print(f"Requests: {total} in {elapsed:.2f}s ({total / elapsed:.1f} req/s, "
+          f"{users * sessions / elapsed:.2f} sessions/s)")
+    print(f"RSS: {format_mb(rss_before)} at start, {format_mb(rss_loaded)} after load, "
+          f"{format_mb(rss_after)} after test")
+    if rss_loaded is not None and rss_after is not None:
+        print(f"Memory growth during test: {rss_after - rss_loaded:+.1f} MB")
+    print()
+    print(f"{'Callback':<32}{'Calls':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for output, samples in sorted(timings.items()):
+        p50, p95, p99 = np.percentile(np.array(samples) * 1000, [50, 95, 99])
+        print(f"{output:<32}{len(samples):>8}{p50:>10.1f}{p95:>10.1f}{p99:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the dashboard callbacks.")
+    parser.add_argument("--data-folder", default="sample_data")
+    parser.add_argument("--users", type=int, default=8, help="Concurrent simulated users")
+    parser.add_argument("--sessions", type=int, default=5, help="Sessions per user")
+    parser.add_argument("--clicks", type=int, default=3, help="Trace clicks per session")
+    parser.add_argument("--synthetic-traces", type=int, default=0,
+                        help="Generate this many synthetic traces instead of using --data-folder")
+    parser.add_argument("--synthetic-points", type=int, default=50_000,
+                        help="Periods per synthetic trace")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if not args.synthetic_traces:
+        run_load_test(args.data_folder, args.users, args.sessions, args.clicks, args.seed)
+        return
+
+    template = sorted(Path(args.data_folder).glob("*.json"))[0]
+    with tempfile.TemporaryDirectory() as folder:
+        generate_synthetic_data(str(template), folder, args.synthetic_traces,
+                                args.synthetic_points, args.seed)
+        run_load_test(folder, args.users, args.sessions, args.clicks, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,9 @@ import plotly.graph_objects as go
 from plotly_resampler import FigureResampler
 
 
-def create_bar_graph(data: dict) -> go.Figure:
-    if not data:
+def create_bar_graph(data: tuple) -> go.Figure:
+    x_vals, y_vals = data
+    if len(x_vals) == 0:
         fig = go.Figure()
         fig.update_layout(
             title="No Loop Count Data Available",
@@ -12,9 +13,6 @@ def create_bar_graph(data: dict) -> go.Figure:
         )
         return fig
 
-    x_vals = [str(k) for k in data.keys()]
-    y_vals = list(data.values())
-
     fig = go.Figure(
         data=[
             go.Bar(
@@ -32,7 +30,8 @@ def create_bar_graph(data: dict) -> go.Figure:
         yaxis_title="Frequency (Times Encountered)",
         template="plotly_white",
         bargap=0.2,
-        height=500
+        height=500,
+        xaxis_type="category"
     )
 
     return fig
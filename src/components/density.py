@@ -0,0 +1,129 @@
+import numpy as np
+import plotly.graph_objects as go
+
+TIME_BINS = 256
+MPKBR_BINS = 128
+
+
+def bin_spans(n: int, x_range: tuple, bins: int) -> tuple[np.ndarray, np.ndarray]:
+    """Index span [start, end) of the samples overlapping each of `bins` slices of `x_range`.
+
+    Sample i covers normalized time [i/n, (i+1)/n), so every bin overlaps at
+    least one sample even when zoomed in further than the sample resolution.
+    """
+    x0, x1 = x_range
+    edges = x0 + (x1 - x0) * np.arange(bins + 1) / bins
+    starts = np.floor(edges[:-1] * n).astype(int).clip(0, n - 1)
+    ends = np.maximum(np.ceil(edges[1:] * n).astype(int).clip(1, n), starts + 1)
+    return starts, ends
+
+
+def rasterize_traces(series_list: list[np.ndarray], x_range: tuple, bins: int = TIME_BINS) -> np.ndarray:
+    """Mean value of every series in `bins` equal slices of normalized time `x_range`.
+
+    Only the samples inside the visible range are touched. Empty series give NaN rows.
+    """
+    raster = np.full((len(series_list), bins), np.nan, dtype=np.float32)
+
+    for row, series in enumerate(series_list):
+        n = len(series)
+        if n == 0:
+            continue
+
+        starts, ends = bin_spans(n, x_range, bins)
+        lo, hi = starts[0], ends[-1]
+        sums = np.concatenate(([0.0], np.cumsum(series[lo:hi], dtype=np.float64)))
+        raster[row] = (sums[ends - lo] - sums[starts - lo]) / (ends - starts)
+
+    return raster
+
+
+def rasterize_density(series_list: list[np.ndarray], x_range: tuple, y_range: tuple,
+                      x_bins: int = TIME_BINS, y_bins: int = MPKBR_BINS) -> np.ndarray:
+    """Number of samples of all series overlapping each (MPKBr, normalized time) cell."""
+    y0, y1 = y_range
+    counts = np.zeros(y_bins * x_bins, dtype=np.int64)
+
+    for series in series_list:
+        n = len(series)
+        if n == 0:
+            continue
+
+        # Expand every bin into the indices of the samples overlapping it
+        starts, ends = bin_spans(n, x_range, x_bins)
+        lengths = ends - starts
+        cols = np.repeat(np.arange(x_bins), lengths)
+        offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        values = series[np.repeat(starts, lengths) + offsets]
+
+        rows = ((values - y0) * (y_bins / (y1 - y0))).astype(int)
+        visible = (values >= y0) & (values <= y1)
+        counts += np.bincount(rows[visible].clip(0, y_bins - 1) * x_bins + cols[visible],
+                              minlength=y_bins * x_bins)
+
+    return counts.reshape(y_bins, x_bins)
+
+
+def parse_relayout_range(relayout_data: dict, axis: str):
+    """Return the zoomed range of `axis`, "auto" after a reset or None if unchanged."""
+    if not relayout_data:
+        return None
+    if relayout_data.get(f"{axis}.autorange"):
+        return "auto"
+    if f"{axis}.range[0]" in relayout_data:
+        return relayout_data[f"{axis}.range[0]"], relayout_data[f"{axis}.range[1]"]
+    if f"{axis}.range" in relayout_data:
+        return tuple(relayout_data[f"{axis}.range"])
+    return None
+
+
+def create_density_overview(series_list: list[np.ndarray], trace_names: list[str], mode: str,
+                            x_range: tuple = (0.0, 1.0), y_range: tuple = None) -> go.Figure:
+    if not series_list:
+        fig = go.Figure()
+        fig.update_layout(
+            title="No MPKBr periodic data available",
+            template="plotly_white",
+            height=600,
+        )
+        return fig
+
+    x0, x1 = x_range
+    x_vals = x0 + (np.arange(TIME_BINS) + 0.5) * (x1 - x0) / TIME_BINS
+
+    if mode == "traces":
+        raster = rasterize_traces(series_list, x_range)
+        fig = go.Figure(go.Heatmap(
+            z=raster,
+            x=x_vals,
+            y=trace_names,
+            colorscale='Viridis',
+            zmin=0,
+            zmax=float(np.nanpercentile(raster, 99)) if np.isfinite(raster).any() else None,
+            colorbar=dict(title="Mean MPKBr"),
+            hovertemplate='%{y}<br>Time: %{x:.3f}<br>Mean MPKBr: %{z:.2f}<extra></extra>',
+        ))
+        # Height is capped, rows of large suites are reached by zooming the y axis
+        fig.update_layout(yaxis_title="Trace", height=min(max(400, 12 * len(trace_names)), 800))
+    else:
+        y0, y1 = y_range
+        counts = rasterize_density(series_list, x_range, y_range)
+        y_vals = y0 + (np.arange(MPKBR_BINS) + 0.5) * (y1 - y0) / MPKBR_BINS
+        fig = go.Figure(go.Heatmap(
+            z=np.log10(counts + 1, dtype=np.float32),
+            x=x_vals,
+            y=y_vals,
+            colorscale='Viridis',
+            colorbar=dict(title="log10(count + 1)"),
+            hovertemplate='Time: %{x:.3f}<br>MPKBr: %{y:.1f}<br>log10(periods + 1): %{z:.2f}<extra></extra>',
+        ))
+        fig.update_layout(yaxis_title="MPKBr", height=600)
+
+    fig.update_layout(
+        title="MPKBr Density across All Traces",
+        xaxis_title="Normalized Time",
+        template="plotly_white",
+        uirevision=mode,
+    )
+
+    return fig
@@ -1,9 +1,10 @@
 import math
+import numpy as np
 import plotly.graph_objects as go
 
 
-def create_heatmap(mpkbr_periodic: list) -> go.Figure:
-    if not mpkbr_periodic:
+def create_heatmap(bimodal_table: np.ndarray) -> go.Figure:
+    if len(bimodal_table) == 0:
         fig = go.Figure()
         fig.update_layout(
             title="No MPKBr periodic data available",
@@ -12,21 +13,11 @@ def create_heatmap(mpkbr_periodic: list) -> go.Figure:
         )
         return fig
 
-    data_len = len(mpkbr_periodic)
-    actual_size = int(math.sqrt(data_len))
+    data_len = len(bimodal_table)
+    actual_size = math.isqrt(data_len)
 
-
-    # Reshape data into 2D array
-    heatmap_data = []
-    for i in range(actual_size):
-        start_idx = i * actual_size
-        end_idx = start_idx + actual_size
-        if end_idx <= len(mpkbr_periodic):
-            heatmap_data.append(mpkbr_periodic[start_idx:end_idx])
-        else:
-            # Pad with zeros if needed
-            row = mpkbr_periodic[start_idx:] + [0] * (end_idx - len(mpkbr_periodic))
-            heatmap_data.append(row)
+    # Reshape data into 2D array, a view of the largest square prefix
+    heatmap_data = bimodal_table[:actual_size * actual_size].reshape(actual_size, actual_size)
 
     fig = go.Figure(data=go.Heatmap(
         z=heatmap_data,
@@ -1,8 +1,9 @@
 import plotly.graph_objects as go
+from src.trace_data import TraceData
 
 
-def create_src_misp_graph(trace_data: dict) -> go.Figure:
-    if not trace_data:
+def create_src_misp_graph(trace_data: TraceData) -> go.Figure:
+    if trace_data is None:
         fig = go.Figure()
         fig.update_layout(
             title="No MPKBr periodic data available",
@@ -24,16 +25,17 @@ def create_src_misp_graph(trace_data: dict) -> go.Figure:
 
     source = [ 0, 1, 2, 3, 4, 4, 4, 5, 5, 5 ]
     target = [ 4, 5, 4, 5, 6, 6, 7, 7, 7, 6]
-    value = [
-        trace_data.get("tage_correct", 0), trace_data.get("tage_incorrect", 0),
-        trace_data.get("loop_correct", 0), trace_data.get("loop_incorrect", 0),
-        trace_data.get("inter_correct_sc_agree", 0),
-        trace_data.get("inter_correct_sc_flip_ignored", 0),
-        trace_data.get("inter_correct_sc_flip", 0),
-        trace_data.get("inter_incorrect_sc_agree", 0),
-        trace_data.get("inter_incorrect_sc_flip_ignored", 0),
-        trace_data.get("inter_incorrect_sc_flip", 0),
+    values = [
+        trace_data.tage_correct, trace_data.tage_incorrect,
+        trace_data.loop_correct, trace_data.loop_incorrect,
+        trace_data.inter_correct_sc_agree,
+        trace_data.inter_correct_sc_flip_ignored,
+        trace_data.inter_correct_sc_flip,
+        trace_data.inter_incorrect_sc_agree,
+        trace_data.inter_incorrect_sc_flip_ignored,
+        trace_data.inter_incorrect_sc_flip,
     ]
+    value = [v if v is not None else 0 for v in values]
 
     link_colors = [
         "rgba(60, 179, 113, 0.4)",
@@ -1,11 +1,12 @@
 import plotly.graph_objects as go
 from plotly_resampler import FigureResampler
 
+import numpy as np
 import pandas as pd
 from plotly_resampler.aggregation import EveryNthPoint
 
-def create_stacked_area(data_lists: list[list], trace_names: list[str] = None) -> go.Figure:
-    if not data_lists:
+def create_stacked_area(data_lists: np.ndarray, trace_names: list[str] = None) -> go.Figure:
+    if len(data_lists) == 0:
         fig = go.Figure()
         fig.update_layout(
             title="No MPKBr periodic data available",
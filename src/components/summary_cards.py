@@ -1,15 +1,16 @@
 from dash import html
 from src.utils import format_large_number
+from src.trace_data import TraceData
 
 
-def create_summary_cards(trace_data: dict) -> list:
+def create_summary_cards(trace_data: TraceData) -> list:
     stats = [
-        ("Total Instructions", trace_data.get("NUM_INSTRUCTIONS"), "instructions"),
-        ("Total Branches", trace_data.get("NUM_BR"), "branches"),
-        ("Unconditional Branches", trace_data.get("NUM_UNCOND_BR"), "branches"),
-        ("Conditional Branches", trace_data.get("NUM_CONDITIONAL_BR"), "branches"),
-        ("Mispredictions", trace_data.get("NUM_MISPREDICTIONS"), "mispredictions"),
-        ("Mispred/1K Instructions", trace_data.get("MISPRED_PER_1K_INST"), ""),
+        ("Total Instructions", trace_data.NUM_INSTRUCTIONS, "instructions"),
+        ("Total Branches", trace_data.NUM_BR, "branches"),
+        ("Unconditional Branches", trace_data.NUM_UNCOND_BR, "branches"),
+        ("Conditional Branches", trace_data.NUM_CONDITIONAL_BR, "branches"),
+        ("Mispredictions", trace_data.NUM_MISPREDICTIONS, "mispredictions"),
+        ("Mispred/1K Instructions", trace_data.MISPRED_PER_1K_INST, ""),
     ]
 
     cards = []
@@ -1,9 +1,10 @@
+import numpy as np
 import plotly.graph_objects as go
 from plotly_resampler import FigureResampler
 
 
-def create_timeseries(mpkbr_periodic: list) -> go.Figure:
-    if not mpkbr_periodic:
+def create_timeseries(mpkbr_periodic: np.ndarray) -> go.Figure:
+    if len(mpkbr_periodic) == 0:
         fig = go.Figure()
         fig.update_layout(
             title="No MPKBr periodic data available",
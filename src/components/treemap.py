@@ -2,7 +2,7 @@ import plotly.graph_objects as go
 from src.utils import parse_data_for_treemap
 
 
-def create_tree_map(size_map: dict) -> go.Figure:
+def create_tree_map(size_map: tuple) -> go.Figure:
     if not size_map:
         fig = go.Figure()
         fig.update_layout(
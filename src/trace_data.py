@@ -0,0 +1,153 @@
+import hashlib
+import json
+
+import numpy as np
+
+
+SCALAR_FIELDS = (
+    "TRACE",
+    "NUM_INSTRUCTIONS",
+    "NUM_BR",
+    "NUM_UNCOND_BR",
+    "NUM_CONDITIONAL_BR",
+    "NUM_MISPREDICTIONS",
+    "MISPRED_PER_1K_INST",
+    "MPKBr_1K",
+    "MPKBr_10K",
+    "MPKBr_100K",
+    "MPKBr_1M",
+    "MPKBr_10M",
+    "MPKBr_30M",
+    "MPKBr_60M",
+    "MPKBr_100M",
+    "MPKBr_300M",
+    "MPKBr_600M",
+    "MPKBr_1B",
+    "MPKBr_10B",
+    "tage_correct",
+    "tage_incorrect",
+    "loop_correct",
+    "loop_incorrect",
+    "inter_correct_sc_agree",
+    "inter_correct_sc_flip",
+    "inter_correct_sc_flip_ignored",
+    "inter_incorrect_sc_agree",
+    "inter_incorrect_sc_flip",
+    "inter_incorrect_sc_flip_ignored",
+)
+
+SERIES_FIELDS = (
+    "MPKBr_periodic",
+    "heatmap_bimodal_table",
+    "tage_usefull_entries",
+    "loop_count_keys",
+    "loop_count_values",
+    "size_map",
+    "size_map_hash",
+)
+
+SUMMARY_FIELDS = (
+    "MPKBr_sparkline",
+    "tage_sparkline",
+)
+
+SPARKLINE_POINTS = 64
+
+
+class TraceData:
+    """Compact in-memory representation of a single simulated trace.
+
+    Scalars are kept as plain attributes, series as NumPy arrays at the
+    narrowest dtype that holds them and the loop predictor counts as two
+    dense arrays sorted by loop length. Per-configuration data such as the
+    size map is interned in `interned`, so traces of the same run share it.
+    Fixed size summaries of the long series are precomputed for the trace table.
+    """
+
+    __slots__ = SCALAR_FIELDS + SERIES_FIELDS + SUMMARY_FIELDS
+
+    def __init__(self, raw: dict, interned: dict | None = None):
+        for field in SCALAR_FIELDS:
+            # Missing scalars stay None so they are shown as "N/A"
+            setattr(self, field, raw.get(field))
+
+        self.MPKBr_periodic = np.asarray(raw.get("MPKBr_periodic", []), dtype=np.float32)
+        self.heatmap_bimodal_table = narrow_int_array(raw.get("heatmap_bimodal_table", []))
+        self.tage_usefull_entries = narrow_int_array(raw.get("tage_usefull_entries", []))
+        self.loop_count_keys, self.loop_count_values = parse_loop_counts(
+            raw.get("loop_predictor_loop_counts", [])
+        )
+        self.size_map_hash, self.size_map = intern_by_content(
+            raw.get("size_map", []), parse_size_map, interned if interned is not None else {}
+        )
+
+        tage_total = self.tage_usefull_entries
+        if tage_total.ndim == 2:
+            tage_total = tage_total.sum(axis=0)
+        self.MPKBr_sparkline = minmax_summary(self.MPKBr_periodic, SPARKLINE_POINTS)
+        self.tage_sparkline = minmax_summary(tage_total, SPARKLINE_POINTS)
+
+
+def content_hash(data) -> str:
+    """Hash of the canonical JSON encoding of `data`."""
+    encoded = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def intern_by_content(data, convert, interned: dict) -> tuple[str, object]:
+    """Convert `data` once per distinct content and return (hash, shared value)."""
+    key = content_hash(data)
+    if key not in interned:
+        interned[key] = convert(data)
+    return key, interned[key]
+
+
+def minmax_summary(series: np.ndarray, num_points: int) -> np.ndarray:
+    """Downsample `series` to `num_points` values keeping each bucket's min and max.
+
+    The two extremes of a bucket are kept in their original order, so spikes
+    survive the downsampling. An odd `num_points` is rounded down to even.
+    """
+    series = np.nan_to_num(np.asarray(series, dtype=np.float32))
+    if len(series) <= num_points:
+        return series
+
+    num_buckets = num_points // 2
+    bounds = np.linspace(0, len(series), num_buckets + 1).astype(int)
+    summary = np.empty(2 * num_buckets, dtype=np.float32)
+    for i, (start, end) in enumerate(zip(bounds[:-1], bounds[1:])):
+        bucket = series[start:end]
+        first, second = sorted((bucket.argmin(), bucket.argmax()))
+        summary[2 * i] = bucket[first]
+        summary[2 * i + 1] = bucket[second]
+
+    return summary
+
+
+def narrow_int_array(values) -> np.ndarray:
+    """Convert (nested) integer lists into an array of the smallest fitting dtype."""
+    array = np.asarray(values, dtype=np.int64)
+    if array.size == 0:
+        return array.astype(np.uint8)
+
+    dtype = np.result_type(np.min_scalar_type(array.min()), np.min_scalar_type(array.max()))
+    return array.astype(dtype)
+
+
+def parse_loop_counts(data: list) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Parses the raw list of {"key", "value"} dicts into dense key/value arrays sorted by key.
+    """
+    keys = narrow_int_array([item.get("key", 0) for item in data])
+    values = narrow_int_array([item.get("value", 0) for item in data])
+
+    order = np.argsort(keys, kind="stable")
+    return keys[order], values[order]
+
+
+def parse_size_map(data: list) -> tuple:
+    """Convert the raw size map into nested (key, value) tuples."""
+    return tuple(
+        (item['key'], parse_size_map(item['value']) if isinstance(item['value'], list) else item['value'])
+        for item in data
+    )
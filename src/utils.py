@@ -1,8 +1,13 @@
 import json
+import re
 import yaml
 import os
 from pathlib import Path
 
+import numpy as np
+
+from src.trace_data import TraceData
+
 
 def load_simulation_data(json_path: str) -> dict:
     """Load simulation results from JSON file."""
@@ -13,9 +18,11 @@ def load_simulation_data(json_path: str) -> dict:
 def load_all_simulation_data(data_folder: str) -> dict:
     """Load all simulation results from JSON files in a folder.
 
-    Returns a dict mapping trace names to their data.
+    Returns a dict mapping trace names to their TraceData.
     """
     all_data = {}
+    # Content hash -> shared value, e.g. one size map per predictor configuration
+    interned = {}
     folder_path = Path(data_folder)
 
     for json_file in folder_path.glob("*.json"):
@@ -23,23 +30,26 @@ def load_all_simulation_data(data_folder: str) -> dict:
             with open(json_file, 'r') as f:
                 file_data = json.load(f)
                 # Each JSON file may contain multiple traces
-                all_data.update(file_data)
+                for trace_name, trace_data in file_data.items():
+                    all_data[trace_name] = TraceData(trace_data, interned)
         except (json.JSONDecodeError, IOError) as e:
             print(f"Warning: Could not load {json_file}: {e}")
 
     return all_data
 
 
-def extract_trace_summary(trace_name: str, trace_data: dict) -> dict:
+def extract_trace_summary(trace_name: str, trace_data: TraceData) -> dict:
     """Extract summary statistics from a trace for table display."""
     return {
         "Trace": trace_name,
-        "NUM_INSTRUCTIONS": trace_data.get("NUM_INSTRUCTIONS", 0),
-        "NUM_BR": trace_data.get("NUM_BR", 0),
-        "NUM_UNCOND_BR": trace_data.get("NUM_UNCOND_BR", 0),
-        "NUM_CONDITIONAL_BR": trace_data.get("NUM_CONDITIONAL_BR", 0),
-        "NUM_MISPREDICTIONS": trace_data.get("NUM_MISPREDICTIONS", 0),
-        "MISPRED_PER_1K_INST": trace_data.get("MISPRED_PER_1K_INST", 0.0),
+        "NUM_INSTRUCTIONS": trace_data.NUM_INSTRUCTIONS or 0,
+        "NUM_BR": trace_data.NUM_BR or 0,
+        "NUM_UNCOND_BR": trace_data.NUM_UNCOND_BR or 0,
+        "NUM_CONDITIONAL_BR": trace_data.NUM_CONDITIONAL_BR or 0,
+        "NUM_MISPREDICTIONS": trace_data.NUM_MISPREDICTIONS or 0,
+        "MISPRED_PER_1K_INST": trace_data.MISPRED_PER_1K_INST or 0.0,
+        "MPKBR_SPARKLINE": format_sparkline(trace_data.MPKBr_sparkline),
+        "TAGE_SPARKLINE": format_sparkline(trace_data.tage_sparkline),
     }
 
 
@@ -49,20 +59,17 @@ def load_predictor_config(yaml_path: str) -> dict:
         return yaml.safe_load(f)
 
 
-def parse_data_for_treemap(data, root_name):
+def parse_data_for_treemap(data: tuple, root_name):
     labels = [root_name]
     parents = [""]
     values = [0]
 
     def recursive_parse(node_list, parent_name):
-        for item in node_list:
-            key = item['key']
-            val = item['value']
-
+        for key, val in node_list:
             labels.append(key)
             parents.append(parent_name)
 
-            if isinstance(val, list):
+            if isinstance(val, tuple):
                 # Container node
                 values.append(0)
                 recursive_parse(val, key)
@@ -74,21 +81,15 @@ def parse_data_for_treemap(data, root_name):
 
     return labels, parents, values
 
-def parse_data_for_loop_frequencies(data: dict) -> dict:
+def parse_data_for_loop_frequencies(trace_data: TraceData) -> tuple:
     """
-    Parses the raw dictionary object into a sorted frequency dictionary.
+    Returns the loop lengths and their frequencies, already sorted at load time.
     """
-    if not data:
-        return {}
-
-    sorted_data = sorted(data, key=lambda x: x.get("key", 0))
-
-    result_dict = {
-        item.get("key"): item.get("value") 
-        for item in sorted_data
-    }
+    return trace_data.loop_count_keys, trace_data.loop_count_values
 
-    return result_dict
+def natural_sort_key(name: str) -> list:
+    """Sort key ordering embedded numbers numerically, e.g. "SUITE-7" before "SUITE-10"."""
+    return [int(part) if part.isdigit() else part for part in re.split(r'(\d+)', name)]
 
 def format_large_number(num: int | float) -> str:
     """Format large numbers with appropriate suffixes."""
@@ -102,3 +103,18 @@ def format_large_number(num: int | float) -> str:
         return f"{num / 1e3:.2f}K"
     else:
         return f"{num:.2f}"
+
+
+SPARKLINE_BLOCKS = "▁▂▃▄▅▆▇█"
+
+
+def format_sparkline(summary: np.ndarray) -> str:
+    """Render a short series as a string of block characters scaled to its own range."""
+    if len(summary) == 0:
+        return ""
+    low, high = summary.min(), summary.max()
+    if high == low:
+        levels = np.zeros(len(summary), dtype=int)
+    else:
+        levels = ((summary - low) / (high - low) * (len(SPARKLINE_BLOCKS) - 1)).round().astype(int)
+    return "".join(SPARKLINE_BLOCKS[level] for level in levels)